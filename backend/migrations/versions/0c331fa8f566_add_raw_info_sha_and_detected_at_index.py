@@ -0,0 +1,33 @@
+"""add raw_info_sha and detected_at index
+
+Tables are still created by db.create_all(), which already includes both of
+these on a fresh database, so the statements are idempotent and only do work
+on databases created before they were added to the models.
+
+Revision ID: 0c331fa8f566
+Revises: 
+Create Date: 2026-10-14 08:38:47.602180
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c331fa8f566'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE yubikeys ADD COLUMN IF NOT EXISTS raw_info_sha VARCHAR(64)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_detections_detected_at_serial "
+        "ON yubikey_detections (detected_at DESC, serial)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_detections_detected_at_serial")
+    op.execute("ALTER TABLE yubikeys DROP COLUMN IF EXISTS raw_info_sha")
@@ -178,20 +178,31 @@ export default function YubiKeyManager() {
       console.log("Disconnected from WebSocket");
     });
 
-    const handleYubiKeysUpdate = (data: { yubikeys: YubiKey[] }) => {
-      console.log("Received yubikeys_update:", data);
-      setYubiKeys(data.yubikeys || []);
+    const handleYubiKeysDelta = (data: {
+      added: YubiKey[];
+      removed: number[];
+    }) => {
+      console.log("Received yubikeys_delta:", data);
+      const added = data.added || [];
+      const dropped = new Set([
+        ...(data.removed || []),
+        ...added.map((key) => key.serial),
+      ]);
+      setYubiKeys((keys) => [
+        ...keys.filter((key) => !dropped.has(key.serial)),
+        ...added,
+      ]);
       loadDatabaseKeys();
       loadStats();
     };
 
-    socket.on("yubikeys_update", handleYubiKeysUpdate);
+    socket.on("yubikeys_delta", handleYubiKeysDelta);
 
     // Initial data load
     loadYubiKeys();
 
     return () => {
-      socket.off("yubikeys_update", handleYubiKeysUpdate);
+      socket.off("yubikeys_delta", handleYubiKeysDelta);
       socket.disconnect();
     };
   }, [loadYubiKeys, loadDatabaseKeys, loadStats]);